@@ -94,6 +94,21 @@ class TestRouterAuth:
         )
         assert resp.status_code == 200
 
+    def test_verified_key_skips_pbkdf2_on_repeat(self):
+        from unittest.mock import patch
+        import xcore.kernel.api.router as router_mod
+
+        app, _ = _make_app()
+        client = TestClient(app, raise_server_exceptions=False)
+        headers = {"X-Plugin-Key": "test-secret"}
+        with patch.object(router_mod, "_hash_key", wraps=router_mod._hash_key) as h:
+            assert client.get("/ipc/status", headers=headers).status_code == 200
+            assert client.get("/ipc/status", headers=headers).status_code == 200
+            assert h.call_count == 1
+            bad = client.get("/ipc/status", headers={"X-Plugin-Key": "wrong-key"})
+            assert bad.status_code == 401
+            assert h.call_count == 2
+
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
@@ -140,11 +155,33 @@ class TestRouterEndpoints:
         )
         assert resp.status_code == 500
 
+    def test_call_plugin_invalid_status_fails_response_validation(self):
+        self.supervisor.call = AsyncMock(return_value={"status": None})
+        resp = self.client.post(
+            "/ipc/auth/ping",
+            json={"payload": {}},
+            headers=self.headers,
+        )
+        assert resp.status_code == 500
+
     def test_status_endpoint(self):
         resp = self.client.get("/ipc/status", headers=self.headers)
         assert resp.status_code == 200
         assert "plugins" in resp.json()
 
+    def test_status_endpoint_pagination(self):
+        resp = self.client.get(
+            "/ipc/status", params={"offset": 2, "limit": 10}, headers=self.headers
+        )
+        assert resp.status_code == 200
+        self.supervisor.status.assert_called_once_with(offset=2, limit=10)
+
+    def test_status_endpoint_rejects_bad_limit(self):
+        resp = self.client.get(
+            "/ipc/status", params={"limit": 0}, headers=self.headers
+        )
+        assert resp.status_code == 422
+
     def test_reload_plugin(self):
         resp = self.client.post(
             "/ipc/auth/reload",
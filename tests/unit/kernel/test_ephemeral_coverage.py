@@ -409,6 +409,51 @@ class TestWarmPoolCoverage:
         assert pool._available.qsize() == 1
         assert pool._total == 1
 
+    async def test_idle_sweeper_skips_drain_when_not_above_pool_size(self):
+        """_idle_sweeper ne draine pas la queue si elle ne dépasse pas pool_size."""
+        from unittest.mock import patch
+        from xcore.kernel.runtime.warm_pool import WarmPool, _PoolEntry
+
+        pool = WarmPool(_manifest(), _ctx(), pool_size=2, max_concurrent=5)
+        await pool._available.put(_PoolEntry(_make_lm()))
+
+        async def _one_tick(_delay):
+            pool._closed = True
+
+        with patch("xcore.kernel.runtime.warm_pool.asyncio.sleep", _one_tick):
+            with patch.object(
+                pool._available, "get_nowait", wraps=pool._available.get_nowait
+            ) as get_nowait:
+                await pool._idle_sweeper()
+
+        get_nowait.assert_not_called()
+        assert pool._available.qsize() == 1
+
+    async def test_idle_sweeper_tick_evicts_excess_idle_entry(self):
+        """Une passe de _idle_sweeper garde la plus fraîche et évince l'excédent idle."""
+        import time
+        from unittest.mock import patch
+        from xcore.kernel.runtime.warm_pool import WarmPool, _PoolEntry
+
+        pool = WarmPool(
+            _manifest(), _ctx(), pool_size=1, max_concurrent=5, max_idle_seconds=1
+        )
+        pool._total = 2
+        fresh = _PoolEntry(_make_lm())
+        old = _PoolEntry(_make_lm())
+        old.idle_since = time.monotonic() - 100
+        await pool._available.put(old)
+        await pool._available.put(fresh)
+
+        async def _one_tick(_delay):
+            pool._closed = True
+
+        with patch("xcore.kernel.runtime.warm_pool.asyncio.sleep", _one_tick):
+            await pool._idle_sweeper()
+
+        assert pool._available.get_nowait() is fresh
+        assert pool._total == 1
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # Activator — EphemeralActivator et LagacyActivator
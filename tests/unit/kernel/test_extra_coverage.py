@@ -67,6 +67,7 @@ class TestSchedulerRedisPath:
         cfg.url = "redis://localhost:6379/0"
         cfg.timezone = "UTC"
         cfg.jobs = []
+        cfg.thread_pool_workers = 0
         svc = SchedulerService(cfg)
 
         with patch.dict("sys.modules", {
@@ -89,6 +90,7 @@ class TestSchedulerRedisPath:
         cfg.url = "redis://localhost:6379/0"
         cfg.timezone = "UTC"
         cfg.jobs = []
+        cfg.thread_pool_workers = 0
         svc = SchedulerService(cfg)
         await svc.init()
 
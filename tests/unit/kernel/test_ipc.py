@@ -4,10 +4,13 @@ Tests for xcore.kernel.sandbox.ipc
 
 import asyncio
 import json
+import uuid
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from xcore.kernel.sandbox import _codec
 from xcore.kernel.sandbox.ipc import (
     IPCChannel,
     IPCError,
@@ -154,3 +157,37 @@ async def test_ipc_close_error_ignored(mock_process):
     # Execute & Verify (should not raise)
     await channel.close()
     mock_process.stdin.close.assert_called_once()
+
+
+def test_codec_dumps_line_roundtrip():
+    line = _codec.dumps_line({"action": "ping", "payload": {"n": 1, "s": "été"}})
+    assert isinstance(line, bytes)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert _codec.loads(line) == {"action": "ping", "payload": {"n": 1, "s": "été"}}
+    assert _codec.loads(line.decode("utf-8")) == _codec.loads(line)
+
+
+@pytest.mark.parametrize(
+    "value", [float("nan"), float("inf"), float("-inf"), "\ud800", 2**70]
+)
+def test_codec_matches_json_module(value):
+    payload = {"x": value}
+    line = _codec.dumps_line(payload)
+    assert line == (json.dumps(payload) + "\n").encode()
+    assert repr(_codec.loads(line)) == repr(json.loads(json.dumps(payload)))
+
+
+def test_codec_decodes_large_ints_exactly():
+    assert _codec.loads(b'{"n": 18446744073709551616}') == {"n": 2**64}
+    assert _codec.loads(_codec.dumps_line({"n": -(2**70)})) == {"n": -(2**70)}
+
+
+@pytest.mark.parametrize("value", [object(), uuid.uuid4(), datetime.now()])
+def test_codec_dumps_line_rejects_unknown_types(value):
+    with pytest.raises(TypeError):
+        _codec.dumps_line({"x": value})
+
+
+def test_codec_loads_invalid_json_raises():
+    with pytest.raises(_codec.JSONDecodeError):
+        _codec.loads("NOT JSON {{")
@@ -60,6 +60,24 @@ class TestDiskWatcher:
         assert stats["ok"] is True
         assert stats["used_pct"] == 0
 
+    def test_check_uses_sampled_size(self, tmp_path):
+        watcher = DiskWatcher(tmp_path, max_disk_mb=1, sample_interval=60)
+        watcher.check("myplugin")  # premier échantillon : dossier vide
+        (tmp_path / "file.dat").write_bytes(b"x" * (2 * 1024 * 1024))
+        watcher.check("myplugin")  # instantané encore frais → pas de re-scan
+        watcher.sample()
+        with pytest.raises(DiskQuotaExceeded):
+            watcher.check("myplugin")
+
+    def test_is_stale(self, tmp_path):
+        watcher = DiskWatcher(tmp_path, max_disk_mb=1, sample_interval=0)
+        assert watcher.is_stale
+        watcher.sample()
+        assert watcher.is_stale  # interval 0 → toujours re-mesuré
+        watcher = DiskWatcher(tmp_path, max_disk_mb=1, sample_interval=60)
+        watcher.sample()
+        assert not watcher.is_stale
+
 
 class TestMemoryLimiter:
     def test_apply_zero_noop(self):
@@ -3,7 +3,10 @@ Tests for RateLimiter.
 """
 
 import time
+from types import SimpleNamespace
+
 import pytest
+from xcore.kernel.sandbox import limits
 from xcore.kernel.sandbox.limits import RateLimiter, RateLimitConfig, RateLimitExceeded, RateLimiterRegistry
 
 def test_rate_limiter_success():
@@ -44,6 +47,22 @@ def test_rate_limiter_stats():
     assert stats["limit"] == 10
     assert stats["remaining"] == 8
 
+
+def test_rate_limiter_stats_excludes_expired(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(limits, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    config = RateLimitConfig(calls=10, period_seconds=0.1)
+    limiter = RateLimiter(config)
+
+    limiter.check("test")
+    now[0] += 0.15
+    limiter.check("test")
+
+    stats = limiter.stats()
+    assert stats["calls_in_window"] == 1
+    assert stats["remaining"] == 9
+
+
 def test_rate_limiter_registry():
     registry = RateLimiterRegistry()
     config = RateLimitConfig(calls=1, period_seconds=1.0)
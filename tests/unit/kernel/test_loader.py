@@ -160,3 +160,20 @@ def test_loader_topo_sort_circular(loader):
 
     with pytest.raises(ValueError, match="Circular"):
         _topo_sort([m1, m2])
+
+
+def test_loader_page_status_slices_load_order(loader):
+    handlers = {}
+    for name in ("charlie", "alpha", "delta", "bravo"):
+        handlers[name] = MagicMock()
+        handlers[name].status.return_value = {"name": name}
+    loader._handlers = handlers
+
+    page = loader.page_status(1, 2)
+
+    assert page == [{"name": "alpha"}, {"name": "delta"}]
+    handlers["charlie"].status.assert_not_called()
+    handlers["bravo"].status.assert_not_called()
+    assert loader.page_status(3) == [{"name": "bravo"}]
+    assert loader.page_status() == loader.status()
+    assert loader.count() == 4
@@ -84,3 +84,40 @@ class TestPermissionEngine:
         p1_log = engine.audit_log(plugin_name="p1", limit=3)
         assert len(p1_log) == 3
         assert all(e["plugin"] == "p1" for e in p1_log)
+
+    def test_allow_events_emitted_on_cache_miss_only(self):
+        from unittest.mock import MagicMock
+
+        events = MagicMock()
+        engine = PermissionEngine(events=events)
+        engine.load_from_manifest(
+            "p", [{"resource": "db.*", "actions": ["read"], "effect": "allow"}]
+        )
+
+        engine.check("p", "db.users", "read")
+        assert events.emit_sync.call_args.args[0] == "permission.allow"
+        events.emit_sync.reset_mock()
+
+        # Allow servi depuis le cache : journalisé, sans événement
+        engine.check("p", "db.users", "read")
+        engine.allows("p", "db.users", "read")
+
+        events.emit_sync.assert_not_called()
+        assert len(engine.audit_log("p")) == 3
+
+    def test_deny_events_emitted_on_every_attempt(self):
+        from unittest.mock import MagicMock
+
+        events = MagicMock()
+        engine = PermissionEngine(events=events)
+        engine.load_from_manifest(
+            "p", [{"resource": "db.*", "actions": ["read"], "effect": "allow"}]
+        )
+
+        for _ in range(2):
+            with pytest.raises(PermissionDenied):
+                engine.check("p", "db.users", "write")
+        assert engine.allows("p", "db.users", "write") is False
+
+        assert events.emit_sync.call_count == 3
+        assert all(c.args[0] == "permission.deny" for c in events.emit_sync.call_args_list)
@@ -229,3 +229,30 @@ class TestPolicySetEdgeCases:
         ps = PolicySet(plugin_name="test", policies=policies)
         assert ps.allows("db.user1.profile", "read") is True
         assert ps.allows("db.user2.settings", "read") is True
+
+
+class TestPolicySetMutation:
+    """PolicySet.evaluate reflects the current policies list."""
+
+    def test_in_place_edit_is_honoured(self):
+        ps = PolicySet(
+            plugin_name="p",
+            policies=[Policy(resource="db.*", actions=["read"], effect=PolicyEffect.DENY)],
+        )
+        assert ps.evaluate("db.users", "read") == PolicyEffect.DENY
+
+        ps.policies[0] = Policy(resource="db.*", actions=["read"])
+        assert ps.evaluate("db.users", "read") == PolicyEffect.ALLOW
+
+        ps.policies[0] = Policy(resource="db.*", actions=["read"], effect=PolicyEffect.DENY)
+        assert ps.evaluate("db.users", "read") == PolicyEffect.DENY
+
+    def test_replace_and_append(self):
+        ps = PolicySet.allow_all("p")
+        assert ps.evaluate("db.users", "read") == PolicyEffect.ALLOW
+
+        ps.policies = []
+        assert ps.evaluate("db.users", "read") == PolicyEffect.DENY
+
+        ps.policies.append(Policy(resource="db.*", actions=["read"]))
+        assert ps.evaluate("db.users", "read") == PolicyEffect.ALLOW
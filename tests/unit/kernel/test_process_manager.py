@@ -149,3 +149,84 @@ async def test_manager_handle_crash_max_restarts(manager, mock_manifest):
 
         assert manager.state == ProcessState.FAILED
         assert manager._restarts == 1
+
+
+@pytest.mark.asyncio
+async def test_manager_call_without_disk_quota_skips_sampling(
+    mock_manifest, mock_loader
+):
+    mock_manifest.resources.max_disk_mb = 0
+    manager = SandboxProcessManager(mock_manifest, mock_loader, config=SandboxConfig())
+    manager._state = ProcessState.RUNNING
+    manager._channel = MagicMock()
+    manager._channel.call = AsyncMock(
+        return_value=IPCResponse(success=True, data={"status": "ok"})
+    )
+
+    with (
+        patch.object(manager._disk, "sample") as sample,
+        patch("asyncio.to_thread", new_callable=AsyncMock) as to_thread,
+    ):
+        await manager.call("hello", {})
+
+    sample.assert_not_called()
+    to_thread.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_manager_status_refreshes_disk_off_loop(manager, tmp_path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "file.dat").write_bytes(b"x" * 1024 * 1024)
+
+    with patch.object(
+        manager._disk, "current_size_bytes", wraps=manager._disk.current_size_bytes
+    ) as walk:
+        first = manager.status()["disk"]
+        assert walk.call_count == 0  # pas de parcours synchrone sur la boucle
+        assert first["used_mb"] == 0
+        await manager._disk_refresh
+        assert walk.call_count == 1
+
+    assert manager.status()["disk"]["used_mb"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_manager_concurrent_calls_share_one_disk_sample(manager):
+    import threading
+
+    manager._state = ProcessState.RUNNING
+    manager._channel = MagicMock()
+    manager._channel.call = AsyncMock(
+        return_value=IPCResponse(success=True, data={"status": "ok"})
+    )
+    gate = threading.Event()
+    real_sample = manager._disk.sample
+
+    def slow_sample():
+        gate.wait(1)
+        return real_sample()
+
+    with patch.object(manager._disk, "sample", side_effect=slow_sample) as sample:
+        calls = [asyncio.create_task(manager.call("hello", {})) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+    assert sample.call_count == 1
+    assert all(r == {"status": "ok"} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_manager_stop_cancels_disk_refresh(manager):
+    import threading
+
+    gate = threading.Event()
+    with patch.object(manager._disk, "sample", side_effect=lambda: gate.wait(1)):
+        manager.status()
+        refresh = manager._disk_refresh
+        assert refresh is not None and not refresh.done()
+        await manager.stop()
+        gate.set()
+
+    assert refresh.cancelled()
+    assert manager._disk_refresh is None
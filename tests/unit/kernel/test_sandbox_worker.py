@@ -325,3 +325,32 @@ class TestFilesystemGuardEdgeCases:
         guard.is_allowed(malicious_path)
         # Should either be False (denied) or resolved to actual path
         # The important thing is it doesn't actually allow access to /etc/passwd
+
+
+class TestSend:
+    """Test _send response framing."""
+
+    def test_send_writes_one_json_line(self):
+        import json
+        from unittest.mock import MagicMock
+
+        from xcore.kernel.sandbox.worker import _send
+
+        transport = MagicMock()
+        _send(transport, {"status": "ok", "result": {"n": 1}})
+        (line,), _ = transport.write.call_args
+        assert line.endswith(b"\n")
+        assert json.loads(line) == {"status": "ok", "result": {"n": 1}}
+
+    def test_send_unserializable_response_becomes_error(self):
+        import json
+        from unittest.mock import MagicMock
+
+        from xcore.kernel.sandbox.worker import _send
+
+        transport = MagicMock()
+        _send(transport, {"status": "ok", "result": object()})
+        (line,), _ = transport.write.call_args
+        data = json.loads(line)
+        assert data["status"] == "error"
+        assert data["code"] == "encode_error"
@@ -106,6 +106,15 @@ class TestSchemaRegistry:
         assert s2 is not None
         assert s2.version == "2.0"
         assert s2.input == {"email": "str", "password": "str"}
+        assert reg2.for_plugin("auth") == [s2]
+
+    def test_for_plugin_reregister_replaces(self):
+        reg = SchemaRegistry()
+        v1 = ActionSchema(plugin="auth", action="login", version="1.0", input={}, output={})
+        v2 = ActionSchema(plugin="auth", action="login", version="2.0", input={}, output={})
+        reg.register(v1)
+        reg.register(v2)
+        assert reg.for_plugin("auth") == [v2]
 
     def test_load_missing_file(self, tmp_path):
         reg = SchemaRegistry.load(tmp_path / "nonexistent.json")
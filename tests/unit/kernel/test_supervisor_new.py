@@ -95,3 +95,36 @@ async def test_retry_middleware(supervisor):
     assert result["status"] == "ok"
     assert result["result"] == "third_time_charm"
     assert handler.call.call_count == 3
+
+
+def test_supervisor_status_pagination(supervisor):
+    rows = [{"name": f"p{i}"} for i in range(1, 3)]
+    supervisor._loader = MagicMock()
+    supervisor._loader.page_status.return_value = rows
+    supervisor._loader.count.return_value = 5
+
+    page = supervisor.status(offset=1, limit=2)
+
+    supervisor._loader.page_status.assert_called_once_with(1, 2)
+    supervisor._loader.all_names.assert_not_called()
+    assert [p["name"] for p in page["plugins"]] == ["p1", "p2"]
+    assert page["count"] == 5
+
+
+def test_supervisor_status_pages_slice_full_listing(supervisor):
+    from xcore.kernel.runtime.loader import PluginLoader
+
+    loader = PluginLoader.__new__(PluginLoader)
+    loader._handlers = {}
+    for name in ("gamma", "alpha", "beta"):
+        loader._handlers[name] = MagicMock()
+        loader._handlers[name].status.return_value = {"name": name}
+    supervisor._loader = loader
+
+    full = supervisor.status()
+    page = supervisor.status(offset=1, limit=1)
+
+    assert [p["name"] for p in full["plugins"]] == ["gamma", "alpha", "beta"]
+    assert page["plugins"] == full["plugins"][1:2]
+    assert supervisor.status(offset=1)["plugins"] == full["plugins"][1:]
+    assert full["count"] == page["count"] == 3
@@ -137,6 +137,13 @@ class TestTracer:
         s.end()
         assert s.duration_ms is not None
 
+    def test_span_ids_are_hex_of_expected_length(self):
+        from xcore.kernel.observability.tracing import Span
+        a, b = Span(name="a"), Span(name="b")
+        assert len(a.trace_id) == 32 and len(a.span_id) == 16
+        int(a.trace_id, 16), int(a.span_id, 16)
+        assert a.trace_id != b.trace_id and a.span_id != b.span_id
+
 
 class TestXcoreLogger:
     def test_logging_all_levels(self):
@@ -241,3 +248,17 @@ class TestXcoreLogger:
         result = formatter.format(record)
         data = json.loads(result)
         assert "trace" in data
+
+    def test_json_formatter_ts_matches_isoformat(self):
+        from datetime import datetime, timezone
+        from xcore.kernel.observability.logging import _JsonFormatter
+        import json
+        import logging
+        formatter = _JsonFormatter()
+        for created in (1700000000.688, 1700000000.9995, 1700000000.9999996, 0.0):
+            record = logging.LogRecord("test", logging.INFO, "", 0, "msg", (), None)
+            record.created = created
+            expected = datetime.fromtimestamp(created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            )
+            assert json.loads(formatter.format(record))["ts"] == expected
@@ -127,3 +127,10 @@ class TestHmac:
         s1 = hmac_sign(b"data1", b"key")
         s2 = hmac_sign(b"data2", b"key")
         assert s1 != s2
+
+    def test_sign_matches_stdlib_hmac(self):
+        import hashlib
+        import hmac
+
+        expected = hmac.new(b"key", b"payload", hashlib.sha256).hexdigest()
+        assert hmac_sign(b"payload", b"key") == expected
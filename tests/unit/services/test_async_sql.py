@@ -115,3 +115,29 @@ class TestAsyncSQLAdapter:
         adapter = AsyncSQLAdapter("test", _make_cfg(execution_options={"isolation_level": "AUTOCOMMIT"}))
         await adapter.connect()
         await adapter.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_passes_pool_sizing(self):
+        from xcore.services.database.adapters.async_sql import AsyncSQLAdapter
+        adapter = AsyncSQLAdapter(
+            "test",
+            _make_cfg(
+                url="postgresql+asyncpg://u:p@h/db",
+                pool_size=20,
+                max_overflow=7,
+                pool_use_lifo=True,
+            ),
+        )
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock(execute=AsyncMock())
+        )
+        engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+        with patch(
+            "sqlalchemy.ext.asyncio.create_async_engine", return_value=engine
+        ) as create:
+            await adapter.connect()
+        kwargs = create.call_args.kwargs
+        assert kwargs["pool_size"] == 20
+        assert kwargs["max_overflow"] == 7
+        assert kwargs["pool_use_lifo"] is True
@@ -171,6 +171,32 @@ class TestServiceContainer:
         result = await container.health()
         assert result["ok"] is False
 
+    @pytest.mark.asyncio
+    async def test_health_tolerates_registration_during_check(self):
+        container = ServiceContainer(_make_config())
+        late = MagicMock(spec=BaseService)
+        svc = MagicMock(spec=BaseService)
+
+        async def _check():
+            container.register_service("late", late)
+            return True, "ok"
+
+        svc.health_check = _check
+        container.register_service("db", svc)
+        result = await container.health()  # pas de "dict changed size"
+        assert "db" in result["services"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_in_reverse_order(self):
+        container = ServiceContainer(_make_config())
+        order = []
+        for name in ("database", "cache", "scheduler"):
+            svc = MagicMock(spec=BaseService)
+            svc.shutdown = AsyncMock(side_effect=lambda n=name: order.append(n))
+            container.register_service(name, svc)
+        await container.shutdown()
+        assert order == ["scheduler", "cache", "database"]
+
     def test_status(self):
         container = ServiceContainer(_make_config())
         svc = MagicMock(spec=BaseService)
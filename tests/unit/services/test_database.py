@@ -112,6 +112,18 @@ class TestSanitizeConnectArgs:
         assert "timeout" in result
         assert "garbage" not in result
 
+    def test_asyncpg_pgbouncer_args(self):
+        from xcore.services.database.adapters._utils import sanitize_connect_args
+        args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        result = sanitize_connect_args("postgresql+asyncpg://pgbouncer:6432/db", args)
+        assert result == args
+
+    def test_psycopg_pgbouncer_args(self):
+        from xcore.services.database.adapters._utils import sanitize_connect_args
+        args = {"prepare_threshold": None, "garbage": 1}
+        result = sanitize_connect_args("postgresql+psycopg://pgbouncer:6432/db", args)
+        assert result == {"prepare_threshold": None}
+
 
 class TestSanitizeIsolationLevel:
     def test_none_returns_none(self):
@@ -226,6 +238,47 @@ class TestSQLAdapter:
                 raise ValueError("test error")
         await adapter.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_ping_runs_off_event_loop_thread(self):
+        import threading
+        from xcore.services.database.adapters.sql import SQLAdapter
+        adapter = SQLAdapter("test", _make_db_config("sqlite:///app.db"))
+        seen = []
+        adapter.execute = lambda sql: seen.append(threading.get_ident())
+        ok, _ = await adapter.ping()
+        assert ok is True
+        assert seen and seen[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_memory_sqlite_stays_on_event_loop_thread(self):
+        from unittest.mock import patch
+
+        from xcore.services.database.adapters.sql import SQLAdapter
+        adapter = SQLAdapter("test", _make_db_config("sqlite:///:memory:"))
+        with patch("asyncio.to_thread") as to_thread:
+            await adapter.connect()
+            adapter.execute("CREATE TABLE items (id INTEGER)")
+            ok, msg = await adapter.ping()
+            # même connexion SingletonThreadPool : la table est toujours visible
+            assert adapter.execute("SELECT COUNT(*) FROM items").scalar() == 0
+            await adapter.disconnect()
+        assert (ok, msg) == (True, "ok")
+        to_thread.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("sqlite://", True),
+            ("sqlite:///:memory:", True),
+            ("sqlite:///file:mem1?mode=memory&cache=shared&uri=true", True),
+            ("sqlite:///app.db", False),
+            ("postgresql://u@h/db", False),
+        ],
+    )
+    def test_is_memory_sqlite(self, url, expected):
+        from xcore.services.database.adapters.sql import _is_memory_sqlite
+        assert _is_memory_sqlite(url) is expected
+
     @pytest.mark.asyncio
     async def test_ping_ok(self):
         from xcore.services.database.adapters.sql import SQLAdapter
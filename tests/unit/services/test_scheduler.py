@@ -10,6 +10,7 @@ def _make_config(**kwargs):
     cfg.url = "redis://localhost:6379/1"
     cfg.timezone = "UTC"
     cfg.jobs = []
+    cfg.thread_pool_workers = 0
     for k, v in kwargs.items():
         setattr(cfg, k, v)
     return cfg
@@ -283,3 +284,154 @@ class TestSchedulerService:
         svc = SchedulerService(_make_config())
         svc.pause_job("x")   # should not raise
         svc.resume_job("x")  # should not raise
+
+
+class TestExecutors:
+    @pytest.mark.asyncio
+    async def test_default_executors(self):
+        from apscheduler.executors.asyncio import AsyncIOExecutor
+        from apscheduler.executors.pool import ThreadPoolExecutor
+        from xcore.services.scheduler.service import SchedulerService
+        svc = SchedulerService(_make_config(thread_pool_workers=3))
+        await svc.init()
+        try:
+            executors = svc._scheduler._executors
+            assert isinstance(executors["default"], AsyncIOExecutor)
+            assert isinstance(executors["threadpool"], ThreadPoolExecutor)
+            assert executors["threadpool"]._pool._max_workers == 3
+        finally:
+            await svc.shutdown()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "executor,is_async",
+        [("default", False), ("default", True), ("threadpool", False)],
+    )
+    async def test_job_runs_on_each_executor(self, executor, is_async):
+        import asyncio
+        import threading
+        from xcore.services.scheduler.service import SchedulerService, _JOB_REGISTRY
+
+        ran = threading.Event()
+        threads = []
+
+        def sync_job():
+            threads.append(threading.current_thread())
+            ran.set()
+
+        async def async_job():
+            sync_job()
+
+        svc = SchedulerService(_make_config())
+        await svc.init()
+        try:
+            job = svc.add_job(
+                async_job if is_async else sync_job,
+                trigger="date",
+                job_id="exec_job",
+                executor=executor,
+            )
+            assert job.executor == executor
+            for _ in range(200):
+                if ran.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            assert ran.is_set()
+            on_main = threads[0] is threading.main_thread()
+            assert on_main is (executor == "default")
+        finally:
+            _JOB_REGISTRY.pop("exec_job", None)
+            await svc.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_threadpool_rejects_coroutine_job(self):
+        from xcore.services.scheduler.service import SchedulerService, _JOB_REGISTRY
+
+        async def async_job():
+            pass
+
+        svc = SchedulerService(_make_config())
+        await svc.init()
+        try:
+            with pytest.raises(ValueError):
+                svc.add_job(async_job, trigger="date", job_id="co_job", executor="threadpool")
+            assert "co_job" not in _JOB_REGISTRY
+        finally:
+            await svc.shutdown()
+
+    def test_threadpool_dispatch_missing_job(self):
+        import xcore.services.scheduler.service as svc_mod
+        svc_mod._dispatch_job_sync("nonexistent")  # should not raise
+
+    def test_threadpool_dispatch_uses_redis_lock(self):
+        import asyncio
+        import threading
+        import xcore.services.scheduler.service as svc_mod
+
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        loop_thread.start()
+        client = MagicMock()
+        client.set = AsyncMock(side_effect=[True, None])
+        client.delete = AsyncMock()
+        called = []
+        svc_mod._JOB_REGISTRY["locked_job"] = lambda: called.append(True)
+        try:
+            with patch.object(svc_mod, "_REDIS_LOCK_CLIENT", client), \
+                    patch.object(svc_mod, "_REDIS_LOCK_LOOP", loop):
+                svc_mod._dispatch_job_sync("locked_job")
+                svc_mod._dispatch_job_sync("locked_job")  # lock occupé → skip
+        finally:
+            svc_mod._JOB_REGISTRY.pop("locked_job", None)
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+        assert called == [True]
+        client.delete.assert_awaited_once_with("xcore:sched:lock:locked_job")
+
+    def test_threadpool_dispatch_skips_when_loop_stopped(self):
+        import asyncio
+        import xcore.services.scheduler.service as svc_mod
+
+        loop = asyncio.new_event_loop()
+        client = MagicMock()
+        called = []
+        svc_mod._JOB_REGISTRY["stopped_job"] = lambda: called.append(True)
+        try:
+            with patch.object(svc_mod, "_REDIS_LOCK_CLIENT", client), \
+                    patch.object(svc_mod, "_REDIS_LOCK_LOOP", loop):
+                svc_mod._dispatch_job_sync("stopped_job")  # ne bloque pas
+                loop.close()
+                svc_mod._dispatch_job_sync("stopped_job")
+        finally:
+            svc_mod._JOB_REGISTRY.pop("stopped_job", None)
+        assert called == []
+        client.set.assert_not_called()
+
+    def test_threadpool_dispatch_release_failure_keeps_job_error(self):
+        import asyncio
+        import threading
+        import xcore.services.scheduler.service as svc_mod
+
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        loop_thread.start()
+        client = MagicMock()
+        client.set = AsyncMock(return_value=True)
+        client.delete = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        def failing_job():
+            raise KeyError("job error")
+
+        svc_mod._JOB_REGISTRY["failing_job"] = failing_job
+        try:
+            with patch.object(svc_mod, "_REDIS_LOCK_CLIENT", client), \
+                    patch.object(svc_mod, "_REDIS_LOCK_LOOP", loop):
+                with pytest.raises(KeyError):
+                    svc_mod._dispatch_job_sync("failing_job")
+        finally:
+            svc_mod._JOB_REGISTRY.pop("failing_job", None)
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+        client.delete.assert_awaited_once()
@@ -95,3 +95,11 @@ class TestConfigLoader:
             ConfigLoader._load_dotenv(raw)
         except ImportError:
             pass  # python-dotenv not installed — ok
+
+    def test_negative_thread_pool_workers_falls_back_to_auto(self, tmp_path):
+        cfg_file = tmp_path / "config.json"
+        cfg_file.write_text(
+            json.dumps({"services": {"scheduler": {"thread_pool_workers": -2}}})
+        )
+        config = ConfigLoader.load(str(cfg_file))
+        assert config.services.scheduler.thread_pool_workers == 0
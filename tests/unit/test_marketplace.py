@@ -31,6 +31,7 @@ def _make_client(tmp_path, **overrides):
                 client._timeout = overrides.get("timeout", 5)
                 client._cache_ttl = overrides.get("cache_ttl", 60)
                 client._cache_dir = tmp_path
+                client._last_sweep = 0.0
     return client
 
 
@@ -148,6 +149,11 @@ class TestCache:
         assert "/" not in path.name
         assert " " not in path.name
 
+    def test_cache_path_distinct_keys_do_not_collide(self, tmp_path):
+        client = _make_simple_client(tmp_path)
+        assert client._cache_path("search_a b") != client._cache_path("search_a_b")
+        assert client._cache_path("search_a b") != client._cache_path("search_a/b")
+
     def test_read_cache_missing_file(self, tmp_path):
         client = _make_simple_client(tmp_path)
         result = client._read_cache("nonexistent_key")
@@ -166,6 +172,20 @@ class TestCache:
         result = client._read_cache("list")
         assert result == [{"name": "auth"}]
 
+    def test_write_cache_is_atomic_and_private(self, tmp_path):
+        client = _make_simple_client(tmp_path)
+
+        def real_cache_path(key):
+            return tmp_path / f"{key}.json"
+
+        client._cache_path = real_cache_path
+        client._write_cache("list", [{"name": "auth"}])
+        client._write_cache("list", [{"name": "billing"}])
+        path = real_cache_path("list")
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.glob("*.tmp")) == []
+        assert client._read_cache("list") == [{"name": "billing"}]
+
     def test_read_cache_expired(self, tmp_path):
         client = _make_simple_client(tmp_path)
         client._cache_ttl = 1
@@ -180,6 +200,34 @@ class TestCache:
         result = client._read_cache("old_key")
         assert result is None
 
+    def test_expired_read_sweeps_all_expired_entries(self, tmp_path):
+        import os
+
+        client = _make_simple_client(tmp_path)
+        client._cache_ttl = 10
+
+        def real_cache_path(key):
+            return tmp_path / f"{key}.json"
+
+        client._cache_path = real_cache_path
+        old = time.time() - 100
+        for key in ("a", "b"):
+            path = real_cache_path(key)
+            path.write_text(json.dumps({"_ts": old, "data": key}))
+            os.utime(path, (old, old))
+        client._write_cache("fresh", "ok")
+        orphan = tmp_path / ".b.x1y2z3.tmp"
+        orphan.write_bytes(b'{"_ts":')
+        os.utime(orphan, (old, old))
+        pending = tmp_path / ".c.a1b2c3.tmp"
+        pending.write_bytes(b"")
+
+        assert client._read_cache("a") is None
+        assert sorted(p.name for p in tmp_path.glob("*.json")) == ["fresh.json"]
+        assert not orphan.exists()
+        assert pending.exists()
+        assert client._read_cache("fresh") == "ok"
+
     def test_read_cache_corrupted(self, tmp_path):
         client = _make_simple_client(tmp_path)
 
@@ -264,6 +264,7 @@ class ConfigLoader:
                 pool_recycle=cfg.get("pool_recycle", 1800),
                 pool_timeout=cfg.get("pool_timeout", 30),
                 pool_reset_on_return=cfg.get("pool_reset_on_return", "rollback"),
+                pool_use_lifo=cfg.get("pool_use_lifo", False),
                 connect_args=cfg.get("connect_args", {}),
                 isolation_level=cfg.get("isolation_level"),
                 execution_options=cfg.get("execution_options", {}),
@@ -278,11 +279,19 @@ class ConfigLoader:
             url=c.get("url"),
         )
         s = d.get("scheduler", {})
+        thread_pool_workers = s.get("thread_pool_workers", 0)
+        if not isinstance(thread_pool_workers, int) or thread_pool_workers < 0:
+            logger.warning(
+                "invalid scheduler.thread_pool_workers, using 0 (auto)",
+                value=str(thread_pool_workers),
+            )
+            thread_pool_workers = 0
         scheduler = SchedulerConfig(
             enabled=s.get("enabled", True),
             backend=s.get("backend", "memory"),
             timezone=s.get("timezone", "UTC"),
             jobs=s.get("jobs", []),
+            thread_pool_workers=thread_pool_workers,
         )
         xworker_raw = d.get("xworker")
         celery_raw = d.get("celery")
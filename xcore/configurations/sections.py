@@ -116,6 +116,9 @@ class DatabaseConfig:
     # Que faire quand une connexion retourne au pool
     # "rollback" (défaut, sûr) | "commit" | "none" (perf max, risqué)
     pool_reset_on_return: str = "rollback"
+    # LIFO : réutilise la connexion la plus récente (caches chauds côté
+    # serveur) et laisse expirer les connexions en trop hors des pics
+    pool_use_lifo: bool = False
 
     # ── Timeouts driver-level ─────────────────────────────────
     # Passés directement au driver (aiomysql, asyncpg, psycopg2…)
@@ -187,6 +190,9 @@ class SchedulerConfig:
     url: str = "redis://localhost:6379/0"
     timezone: str = "UTC"
     jobs: list[dict[str, Any]] = field(default_factory=list)
+    # Executor dédié aux jobs sync bloquants, ciblé par job via `executor="threadpool"`.
+    # 0 → dimensionné sur le CPU (min(32, 2 × cœurs)).
+    thread_pool_workers: int = 0
 
 
 @dataclass
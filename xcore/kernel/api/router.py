@@ -5,6 +5,7 @@ Construit dynamiquement à partir du PluginSupervisor.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 from typing import TYPE_CHECKING, Any, Optional
@@ -12,7 +13,15 @@ from typing import TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
     from ..observability import MetricsRegistry, HealthChecker
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Security, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Security,
+    status,
+)
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel, Field
 
@@ -86,9 +95,14 @@ def build_router(
     # On hash une seule fois au démarrage
     stored_hash = _hash_key(secret_key, server_key, server_key_iterations)
 
+    # Empreinte BLAKE2b-128 de la dernière clé validée : les requêtes suivantes
+    # avec la même clé évitent de rejouer PBKDF2 (server_key_iterations tours)
+    verified_fingerprint: bytes | None = None
+
     async def verify_api_key(
         api_key: str | None = Security(_api_key_header),
     ) -> None:
+        nonlocal verified_fingerprint
 
         if api_key is None:
             raise HTTPException(
@@ -96,7 +110,16 @@ def build_router(
                 detail="API key missing",
             )
 
-        incoming_hash = _hash_key(api_key, server_key, server_key_iterations)
+        fingerprint = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).digest()
+        if verified_fingerprint is not None and hmac.compare_digest(
+            fingerprint, verified_fingerprint
+        ):
+            return
+
+        # PBKDF2 est volontairement coûteux : hors de la boucle d'événements
+        incoming_hash = await asyncio.to_thread(
+            _hash_key, api_key, server_key, server_key_iterations
+        )
 
         # Comparaison sécurisée anti timing attack
         if not hmac.compare_digest(incoming_hash, stored_hash):
@@ -104,6 +127,7 @@ def build_router(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Unauthorized",
             )
+        verified_fingerprint = fingerprint
 
     router = APIRouter(
         prefix=f"{prefix}/ipc",
@@ -125,7 +149,7 @@ def build_router(
         action: str,
         body: CallRequest,
         request: Request,
-    ) -> CallResponse:
+    ) -> dict[str, Any]:
 
         tenant_id = getattr(request.state, "tenant_id", "default")
         result = await supervisor.call(
@@ -144,16 +168,20 @@ def build_router(
                 detail=result.get("msg", "Plugin not found"),
             )
 
-        return CallResponse(
-            status=result.get("status", "ok"),
-            plugin=plugin_name,
-            action=action,
-            result=result,
-        )
+        # dict brut : response_model=CallResponse le valide une seule fois
+        return {
+            "status": result.get("status", "ok"),
+            "plugin": plugin_name,
+            "action": action,
+            "result": result,
+        }
 
     @router.get("/status")
-    async def plugins_status() -> dict[str, Any]:
-        return supervisor.status()
+    async def plugins_status(
+        offset: int = Query(0, ge=0),
+        limit: int | None = Query(None, ge=1, le=1000),
+    ) -> dict[str, Any]:
+        return supervisor.status(offset=offset, limit=limit)
 
     @router.post("/{plugin_name}/reload")
     async def reload_plugin(plugin_name: str) -> dict[str, str]:
@@ -62,7 +62,7 @@ class HealthChecker:
 
     async def run_all(self, timeout: float = 5.0) -> dict[str, Any]:
         results: list[CheckResult] = []
-        for name, (fn, is_async) in self._checks.items():
+        for name, (fn, is_async) in tuple(self._checks.items()):
             start = time.monotonic()
             try:
                 ok, msg = (
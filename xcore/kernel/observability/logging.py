@@ -37,15 +37,48 @@ if TYPE_CHECKING:
 # ── Formateurs ────────────────────────────────────────────────────────────────
 
 
-class _TextFormatter(logging.Formatter):
+def _split_timestamp(created: float) -> tuple[int, int]:
+    """(secondes, microsecondes) avec le même arrondi que datetime.fromtimestamp."""
+    second = int(created)
+    micros = round((created - second) * 1_000_000)
+    if micros >= 1_000_000:
+        second, micros = second + 1, micros - 1_000_000
+    return second, micros
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Base des formateurs : met en cache la partie « à la seconde » de l'horodatage.
+
+    Les logs arrivent en rafales dans la même seconde ; on ne reconstruit le
+    datetime UTC et son strftime que lorsque la seconde change.
+    """
+
+    TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (seconde, préfixe) remplacés d'un bloc : un handler appelé depuis
+        # plusieurs threads ne lit jamais une seconde et un préfixe désaccordés
+        self._ts_cache: tuple[int | None, str] = (None, "")
+
+    def _second_prefix(self, second: int) -> str:
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, tz=timezone.utc).strftime(
+                self.TS_FORMAT
+            )
+            self._ts_cache = (second, prefix)
+        return prefix
+
+
+class _TextFormatter(_SecondCachedFormatter):
     """Format lisible en console avec les champs structurés en fin de ligne."""
 
     LEVEL_WIDTH = 8  # "CRITICAL" est le plus long
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = datetime.fromtimestamp(record.created, tz=timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        ts = self._second_prefix(_split_timestamp(record.created)[0])
         level = f"{record.levelname:<{self.LEVEL_WIDTH}}"
         ctx: dict = getattr(record, "xcore_ctx", {})
         fields = "  " + "  ".join(f"{k}={v}" for k, v in ctx.items()) if ctx else ""
@@ -57,14 +90,19 @@ class _TextFormatter(logging.Formatter):
         return base
 
 
-class _JsonFormatter(logging.Formatter):
+class _JsonFormatter(_SecondCachedFormatter):
     """Format JSON une ligne par entrée — compatible avec les agrégateurs de logs."""
 
+    TS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+    def _timestamp(self, created: float) -> str:
+        # Équivalent à datetime.isoformat(timespec="milliseconds") en UTC.
+        second, micros = _split_timestamp(created)
+        return f"{self._second_prefix(second)}.{micros // 1000:03d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         data: dict[str, Any] = {
-            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
-                timespec="milliseconds"
-            ),
+            "ts": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
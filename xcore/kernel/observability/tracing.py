@@ -4,8 +4,8 @@ tracing.py — Interface de tracing (noop par défaut, OpenTelemetry optionnel).
 
 from __future__ import annotations
 
+import os
 import time
-import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any, Generator
@@ -16,8 +16,9 @@ class Span:
     """Span de tracing."""
 
     name: str
-    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex)
-    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    # Seulement les octets aléatoires utiles (16 / 8) : pas d'UUID tronqué
+    trace_id: str = field(default_factory=lambda: os.urandom(16).hex())
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
     start_time: float = field(default_factory=time.monotonic)
     end_time: float | None = None
     attributes: dict[str, Any] = field(default_factory=dict)
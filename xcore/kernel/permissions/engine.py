@@ -76,7 +76,7 @@ class PermissionEngine:
             effect = self._evaluate_and_cache(plugin_name, resource, action)
             self._audit(plugin_name, resource, action, effect, emit_event=True)
         else:
-            # Cache hit: minimal audit (log entry only, no events)
+            # Cache hit: minimal audit (log entry, deny events only)
             # This keeps audit_log complete while being fast
             self._audit(plugin_name, resource, action, effect, emit_event=False)
 
@@ -145,7 +145,9 @@ class PermissionEngine:
                 action=action,
                 resource=resource,
             )
-        if self._events:
+        # Les refus sont toujours émis (hooks d'alerte sur permission.deny,
+        # y compris sur cache hit) ; seuls les allow en cache hit sont muets.
+        if self._events and (emit_event or effect == PolicyEffect.DENY):
             self._events.emit_sync(f"permission.{effect.value}", entry)
 
     def audit_log(self, plugin_name: str | None = None, limit: int = 100) -> list[dict]:
@@ -11,6 +11,7 @@ Responsabilités :
 from __future__ import annotations
 
 import asyncio
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -310,11 +311,23 @@ class PluginLoader:
         return name in self._handlers
 
     def all_names(self) -> list[str]:
-        return sorted(list(self._handlers.keys()))
+        return sorted(self._handlers)
 
     def status(self) -> list[dict]:
         return [h.status() for h in self._handlers.values()]
 
+    def page_status(self, offset: int = 0, limit: int | None = None) -> list[dict]:
+        """
+        Statut d'une page de plugins, dans l'ordre de chargement comme status() :
+        une page est une tranche exacte de la liste complète. Seuls les handlers
+        de la page sont interrogés, sans tri ni copie de la liste.
+        """
+        stop = None if limit is None else offset + limit
+        return [h.status() for h in islice(self._handlers.values(), offset, stop)]
+
+    def count(self) -> int:
+        return len(self._handlers)
+
     # ── Flush services ────────────────────────────────────────
 
     def _flush_services(self, plugin_names: list[str]) -> None:
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from ..observability import get_logger
 from ..permissions.engine import PermissionEngine
 from ..sandbox.limits import RateLimiterRegistry
+from ..tenancy.services import _current_tenant_id
 from .loader import PluginLoader
 from .middlewares import (
     Middleware,
@@ -56,6 +57,13 @@ class PluginSupervisor:
         self._tracer = ctx.tracer
         self._health = ctx.health
 
+        # Section tenancy résolue une fois : _dispatch() est sur le chemin chaud
+        self._tenancy = getattr(self._config, "tenancy", None)
+        self._tenancy_enabled = bool(
+            self._tenancy is not None and self._tenancy.enabled
+        )
+        self._default_tenant = getattr(self._tenancy, "default_tenant", "default")
+
         self._rate = RateLimiterRegistry()
         self._permissions = PermissionEngine(events=self._events)
 
@@ -110,11 +118,10 @@ class PluginSupervisor:
             final_handler=self._dispatch,
         )
         # IPC auth en premier : bloque avant tout le reste
-        tenancy = getattr(self._config, "tenancy", None)
         self._pipeline.add_middleware(
             IPCAuthMiddleware(
                 self._loader,
-                enforce=tenancy.enforce_ipc if tenancy and tenancy.enabled else False,
+                enforce=self._tenancy.enforce_ipc if self._tenancy_enabled else False,
             ),
             first=True,
         )
@@ -259,23 +266,16 @@ class PluginSupervisor:
         self, plugin_name: str, action: str, payload: dict, handler, **kwargs
     ) -> dict:
         """Dernière étape du pipeline : exécution réelle."""
-        from ..tenancy.services import _current_tenant_id
-
         if handler is None:
             handler = self._loader.get(plugin_name)
 
-        tenancy = (
-            self._ctx.config.tenancy if hasattr(self._ctx.config, "tenancy") else None
-        )
-        tenant_id: str = kwargs.get(
-            "tenant_id", getattr(tenancy, "default_tenant", "default")
-        )
-
         # Les services du plugin sont déjà wrappés (TenantAwareDB/Cache) au chargement.
         # On positionne uniquement le ContextVar pour que les wrappers lisent le bon tenant.
         # Chaque tâche asyncio a sa propre valeur — pas de mutation d'état partagé.
-        if tenancy is not None and tenancy.enabled:
-            token = _current_tenant_id.set(tenant_id)
+        if self._tenancy_enabled:
+            token = _current_tenant_id.set(
+                kwargs.get("tenant_id", self._default_tenant)
+            )
             try:
                 return await handler.call(action, payload)
             finally:
@@ -328,11 +328,19 @@ class PluginSupervisor:
 
     # ── Observabilité ─────────────────────────────────────────
 
-    def status(self) -> dict:
+    def status(self, offset: int = 0, limit: int | None = None) -> dict:
+        """
+        État des plugins, dans l'ordre de chargement. Avec offset/limit, seule
+        la page demandée est matérialisée et c'est une tranche exacte de la
+        liste complète. `count` reste le nombre total de plugins chargés.
+        """
         if self._loader is None:
             return {"plugins": [], "count": 0}
-        items = self._loader.status()
-        return {"plugins": items, "count": len(items)}
+        if not offset and limit is None:
+            items = self._loader.status()
+            return {"plugins": items, "count": len(items)}
+        items = self._loader.page_status(offset, limit)
+        return {"plugins": items, "count": self._loader.count()}
 
     def list_plugins(self) -> list[str]:
         return self._loader.all_names() if self._loader else []
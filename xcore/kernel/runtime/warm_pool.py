@@ -291,6 +291,11 @@ class WarmPool:
         while not self._closed:
             await asyncio.sleep(10)
 
+            # Rien d'évinçable tant que la queue ne dépasse pas pool_size :
+            # on évite de drainer/trier/réenfiler à chaque réveil d'un pool au repos.
+            if self._available.qsize() <= self._pool_size:
+                continue
+
             # Draine toute la queue
             entries: list[_PoolEntry] = []
             while True:
@@ -302,18 +307,23 @@ class WarmPool:
             if not entries:
                 continue
 
-            # Trie les plus fraîches en premier (idle_seconds croissant)
-            entries.sort(key=lambda e: e.idle_seconds)
+            # Une seule lecture d'horloge pour toute la passe.
+            now = time.monotonic()
+
+            # Trie les plus fraîches en premier (idle_since décroissant)
+            entries.sort(key=lambda e: e.idle_since, reverse=True)
 
-            to_discard: list[_PoolEntry] = []
-            to_return: list[_PoolEntry] = []
-            for i, entry in enumerate(entries):
-                # Garde toujours les pool_size instances les plus fraîches
-                # Évince uniquement les entrées excédentaires et effectivement idle
-                if i >= self._pool_size and entry.idle_seconds > self._max_idle_seconds:
-                    to_discard.append(entry)
-                else:
-                    to_return.append(entry)
+            # Garde toujours les pool_size instances les plus fraîches.
+            # La liste étant triée, les entrées excédentaires effectivement
+            # idle forment un suffixe : on cherche sa borne puis on découpe.
+            cut = self._pool_size
+            while (
+                cut < len(entries)
+                and now - entries[cut].idle_since <= self._max_idle_seconds
+            ):
+                cut += 1
+            to_return = entries[:cut]
+            to_discard = entries[cut:]
 
             for entry in to_return:
                 await self._available.put(entry)
@@ -325,7 +335,7 @@ class WarmPool:
                 logger.debug(
                     "[%s] idle sweep : instance déchargée (idle=%.0fs)",
                     self._manifest.name,
-                    entry.idle_seconds,
+                    now - entry.idle_since,
                 )
 
             if to_discard:
@@ -0,0 +1,27 @@
+"""
+_codec.py — Encodage/décodage des lignes JSON du canal IPC sandbox.
+
+Partagé par le Core (ipc.py) et le worker : même framing des deux côtés
+(une ligne JSON terminée par ``\\n``, en bytes). Reste sur le module json
+standard : un encodeur alternatif (orjson) change silencieusement les payloads
+(NaN/Infinity → null, UUID/datetime/dataclass sérialisés au lieu de lever,
+entiers > 64 bits décodés en float).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Exception levée par loads(), réexportée pour les appelants
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps_line(data: Any) -> bytes:
+    """Sérialise ``data`` en une ligne JSON terminée par ``\\n``."""
+    return (json.dumps(data) + "\n").encode("utf-8")
+
+
+def loads(raw: str | bytes) -> Any:
+    """Désérialise une ligne JSON (str ou bytes)."""
+    return json.loads(raw)
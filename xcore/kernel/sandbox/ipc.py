@@ -6,10 +6,11 @@ Fix #1 v1 intégré : UnboundLocalError sur asyncio.TimeoutError corrigé.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass
 
+from . import _codec
+
 logger = logging.getLogger("xcore.sandbox.ipc")
 
 
@@ -53,9 +54,9 @@ class IPCChannel:
             return await self._send_recv(action, payload)
 
     async def _send_recv(self, action: str, payload: dict) -> IPCResponse:
-        line = json.dumps({"action": action, "payload": payload}) + "\n"
+        line = _codec.dumps_line({"action": action, "payload": payload})
         try:
-            self._process.stdin.write(line.encode())
+            self._process.stdin.write(line)
             await self._process.stdin.drain()
         except (BrokenPipeError, ConnectionResetError) as e:
             raise IPCProcessDead(f"Écriture stdin impossible : {e}") from e
@@ -77,8 +78,8 @@ class IPCChannel:
 
         raw_str = raw.decode("utf-8", errors="replace").strip()
         try:
-            data = json.loads(raw_str)
-        except json.JSONDecodeError as exc:
+            data = _codec.loads(raw_str)
+        except _codec.JSONDecodeError as exc:
             raise IPCError(f"JSON invalide : {exc} — reçu : {raw_str!r}") from exc
 
         return IPCResponse(success=data.get("status") == "ok", data=data, raw=raw_str)
@@ -4,6 +4,7 @@ isolation.py — Isolation des ressources disque et mémoire pour les subprocess
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 from ..observability import get_logger
@@ -16,12 +17,24 @@ class DiskQuotaExceeded(Exception):
 
 
 class DiskWatcher:
-    """Surveille le quota disque d'un plugin sandboxed."""
-
-    def __init__(self, data_dir: Path, max_disk_mb: int) -> None:
+    """
+    Surveille le quota disque d'un plugin sandboxed.
+
+    Le parcours du dossier (un stat() par fichier) est échantillonné :
+    check() et stats() lisent le dernier instantané, re-mesuré au plus
+    une fois par sample_interval — le coût suit la fréquence
+    d'échantillonnage, pas le nombre d'appels.
+    """
+
+    def __init__(
+        self, data_dir: Path, max_disk_mb: int, sample_interval: float = 1.0
+    ) -> None:
         self._data_dir = data_dir
         self._max_bytes = max_disk_mb * 1024 * 1024
         self._max_disk_mb = max_disk_mb
+        self._sample_interval = sample_interval
+        self._sampled_bytes = 0
+        self._sampled_at: float | None = None
 
     def current_size_bytes(self) -> int:
         if not self._data_dir.exists():
@@ -31,19 +44,44 @@ class DiskWatcher:
     def current_size_mb(self) -> float:
         return round(self.current_size_bytes() / (1024 * 1024), 3)
 
+    @property
+    def has_quota(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._sampled_at is None
+            or time.monotonic() - self._sampled_at >= self._sample_interval
+        )
+
+    def sample(self) -> int:
+        """Re-mesure le dossier et met à jour l'instantané. Sûr hors event loop."""
+        self._sampled_bytes = self.current_size_bytes()
+        self._sampled_at = time.monotonic()
+        return self._sampled_bytes
+
+    def sampled_size_bytes(self) -> int:
+        return self.sample() if self.is_stale else self._sampled_bytes
+
     def check(self, plugin_name: str) -> None:
         if self._max_bytes == 0:
             return
-        if self.current_size_bytes() > self._max_bytes:
+        used = self.sampled_size_bytes()
+        if used > self._max_bytes:
             raise DiskQuotaExceeded(
                 f"Plugin '{plugin_name}' : quota disque dépassé "
-                f"({self.current_size_mb():.1f}MB / {self._max_disk_mb}MB max)"
+                f"({used / (1024 * 1024):.1f}MB / {self._max_disk_mb}MB max)"
             )
 
-    def stats(self) -> dict:
-        used = self.current_size_bytes()
+    def stats(self, refresh: bool = True) -> dict:
+        """
+        Statistiques disque. `refresh=False` lit l'instantané courant sans
+        parcourir le dossier (appelants sur l'event loop).
+        """
+        used = self.sampled_size_bytes() if refresh else self._sampled_bytes
         return {
-            "used_mb": self.current_size_mb(),
+            "used_mb": round(used / (1024 * 1024), 3),
             "max_mb": self._max_disk_mb,
             "used_pct": (
                 round(used / self._max_bytes * 100, 1) if self._max_bytes else 0
@@ -30,9 +30,7 @@ class RateLimiter:
         en mémoire et sans await, ce qui évite l'overhead d'asyncio.
         """
         now = time.monotonic()
-        cutoff = now - self._config.period_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
+        cutoff = self._prune(now)
         if len(self._timestamps) >= self._config.calls:
             retry_in = round(self._timestamps[0] - cutoff, 2)
             raise RateLimitExceeded(
@@ -42,10 +40,19 @@ class RateLimiter:
             )
         self._timestamps.append(now)
 
-    def stats(self) -> dict:
-        now = time.monotonic()
+    def _prune(self, now: float) -> float:
+        """
+        Retire les horodatages sortis de la fenêtre et retourne le cutoff.
+        Le deque est trié (monotonic) : après purge, len() = appels en fenêtre.
+        """
         cutoff = now - self._config.period_seconds
-        current = sum(t >= cutoff for t in self._timestamps)
+        while self._timestamps and self._timestamps[0] < cutoff:
+            self._timestamps.popleft()
+        return cutoff
+
+    def stats(self) -> dict:
+        self._prune(time.monotonic())
+        current = len(self._timestamps)
         return {
             "calls_in_window": current,
             "limit": self._config.calls,
@@ -68,6 +68,7 @@ class SandboxProcessManager:
         self._ctx = ctx
 
         self._disk = DiskWatcher(data_dir, manifest.resources.max_disk_mb)
+        self._disk_refresh: asyncio.Task | None = None
 
     @property
     def state(self) -> ProcessState:
@@ -170,6 +171,11 @@ class SandboxProcessManager:
     async def call(self, action: str, payload: dict) -> dict:
         if not self.is_available:
             raise RuntimeError(f"Plugin {self.manifest.name} non disponible")
+        # Re-mesure disque dans un thread (le rglob ne bloque pas l'event loop),
+        # uniquement si un quota est défini : sinon check() ne lit rien.
+        # Les appels concurrents attendent la même re-mesure en cours.
+        if self._disk.has_quota and self._disk.is_stale:
+            await asyncio.shield(self._refresh_disk())
         try:
             self._disk.check(self.manifest.name)
         except DiskQuotaExceeded as e:
@@ -291,6 +297,11 @@ class SandboxProcessManager:
         for task in (self._watch_task, self._health_task):
             if task and not task.done():
                 task.cancel()
+        if self._disk_refresh and not self._disk_refresh.done():
+            self._disk_refresh.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._disk_refresh
+        self._disk_refresh = None
         if self._channel:
             await self._channel.close()
         await self._kill()
@@ -313,5 +324,27 @@ class SandboxProcessManager:
             "pid": self._process.pid if self._process else None,
             "restarts": self._restarts,
             "uptime": round(self.uptime, 1) if self.uptime else None,
-            "disk": self._disk.stats(),
+            "disk": self._disk_stats(),
         }
+
+    def _disk_stats(self) -> dict:
+        """
+        Instantané disque pour status() : jamais de parcours sur l'event loop.
+        Un instantané périmé est re-mesuré en arrière-plan dans un thread et
+        sera reflété au prochain appel.
+        """
+        if self._disk.is_stale:
+            with contextlib.suppress(RuntimeError):  # hors event loop : pas de refresh
+                self._refresh_disk()
+        return self._disk.stats(refresh=False)
+
+    def _refresh_disk(self) -> asyncio.Task:
+        """
+        Re-mesure disque dans un thread, dédupliquée : une seule en cours à la
+        fois, partagée par call() et status().
+        """
+        if self._disk_refresh is None or self._disk_refresh.done():
+            self._disk_refresh = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(self._disk.sample)
+            )
+        return self._disk_refresh
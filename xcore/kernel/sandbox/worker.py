@@ -14,7 +14,6 @@ import builtins as _builtins_module
 import contextlib
 import importlib.machinery
 import importlib.util
-import json
 import logging
 import os
 import sys
@@ -23,6 +22,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from xcore.kernel.observability import get_logger
+from xcore.kernel.sandbox import _codec
 
 # ContextVar par tâche asyncio — évite les race conditions entre coroutines
 # qui partageraient le même FilesystemGuard (requis pour la sécurité sandbox).
@@ -669,8 +669,20 @@ def _extracted_from__load_manifest_20(fname, manifest_path, manifest: _PluginMan
 
 
 def _send(transport, data: dict) -> None:
-    line = json.dumps(data) + "\n"
-    transport.write(line.encode("utf-8"))
+    try:
+        line = _codec.dumps_line(data)
+    except (TypeError, ValueError) as e:
+        # Objet refusé par json : on répond une erreur plutôt
+        # que de laisser l'exception tuer la boucle du worker
+        logger.error("response not serializable", error=str(e))
+        line = _codec.dumps_line(
+            {
+                "status": "error",
+                "msg": f"Réponse non sérialisable : {e}",
+                "code": "encode_error",
+            }
+        )
+    transport.write(line)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -734,7 +746,7 @@ async def _run(plugin_dir: Path) -> None:
 
         response: dict
         try:
-            msg = json.loads(raw)
+            msg = _codec.loads(raw)
             action = msg.get("action", "")
             payload = msg.get("payload", {})
 
@@ -759,7 +771,7 @@ async def _run(plugin_dir: Path) -> None:
                 "msg": str(e),
                 "code": "filesystem_denied",
             }
-        except json.JSONDecodeError as e:
+        except _codec.JSONDecodeError as e:
             response = {
                 "status": "error",
                 "msg": f"JSON invalide : {e}",
@@ -70,16 +70,13 @@ class BreakingChangeDetector:
     def detect(self) -> list[BreakingChange]:
         changes: list[BreakingChange] = []
 
-        prev_schemas = {
-            s.key: s
-            for s in self._prev.all()
-            if self._filter is None or s.plugin == self._filter
-        }
-        curr_schemas = {
-            s.key: s
-            for s in self._curr.all()
-            if self._filter is None or s.plugin == self._filter
-        }
+        if self._filter is None:
+            prev_list, curr_list = self._prev.all(), self._curr.all()
+        else:
+            prev_list = self._prev.for_plugin(self._filter)
+            curr_list = self._curr.for_plugin(self._filter)
+        prev_schemas = {s.key: s for s in prev_list}
+        curr_schemas = {s.key: s for s in curr_list}
 
         for key, prev in prev_schemas.items():
             if key not in curr_schemas:
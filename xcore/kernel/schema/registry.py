@@ -63,9 +63,15 @@ class SchemaRegistry:
 
     def __init__(self) -> None:
         self._schemas: dict[str, ActionSchema] = {}
+        # Index secondaire plugin → {key: schema}, tenu à jour à l'insertion
+        self._by_plugin: dict[str, dict[str, ActionSchema]] = {}
 
-    def register(self, schema: ActionSchema) -> None:
+    def _add(self, schema: ActionSchema) -> None:
         self._schemas[schema.key] = schema
+        self._by_plugin.setdefault(schema.plugin, {})[schema.key] = schema
+
+    def register(self, schema: ActionSchema) -> None:
+        self._add(schema)
         logger.debug("schema registered", key=schema.key, version=schema.version)
 
     def get(self, plugin: str, action: str) -> ActionSchema | None:
@@ -78,7 +84,7 @@ class SchemaRegistry:
         return list(self._schemas.values())
 
     def for_plugin(self, plugin: str) -> list[ActionSchema]:
-        return [s for s in self._schemas.values() if s.plugin == plugin]
+        return list(self._by_plugin.get(plugin, {}).values())
 
     def save(self, path: str | Path) -> None:
         path = Path(path)
@@ -93,10 +99,10 @@ class SchemaRegistry:
         registry = cls()
         if not path.exists():
             return registry
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
         for key, d in data.items():
             try:
-                registry._schemas[key] = ActionSchema.from_dict(d)
+                registry._add(ActionSchema.from_dict(d))
             except Exception as exc:
                 logger.warning("schema skipped", key=key, error=str(exc))
         logger.info("schemas loaded", path=str(path), actions=len(registry._schemas))
@@ -105,7 +111,7 @@ class SchemaRegistry:
     def summary(self) -> dict[str, Any]:
         return {
             "total": len(self._schemas),
-            "plugins": sorted({s.plugin for s in self._schemas.values()}),
+            "plugins": sorted(self._by_plugin),
             "actions": [
                 {"key": s.key, "version": s.version, "breaking_since": s.breaking_since}
                 for s in sorted(self._schemas.values(), key=lambda s: s.key)
@@ -37,11 +37,13 @@ def __should_ignore(path: Path, root: Path) -> bool:
     if path.suffix in SUFFIX_IGNORE:
         return True
 
-    if path.is_symlink():
+    # Vérifier les motifs de fichiers à ignorer (en mémoire, avant tout appel
+    # système ; str(path) calculé une seule fois)
+    path_str = str(path)
+    if any(fnmatch.fnmatch(path_str, pattern) for pattern in PATTERNS_IGNORE):
         return True
 
-    # Vérifier les motifs de fichiers à ignorer
-    if any(fnmatch.fnmatch(str(path), pattern) for pattern in PATTERNS_IGNORE):
+    if path.is_symlink():
         return True
 
     return False
@@ -49,11 +51,9 @@ def __should_ignore(path: Path, root: Path) -> bool:
 
 def hash_file(path: Path, algorithm: str = "sha256") -> str:
     """Retourne le hash hex d'un fichier."""
-    h = hashlib.new(algorithm)
+    # file_digest : lecture par blocs dans un tampon réutilisé, GIL relâché
     with open(path, "rb") as f:
-        while chunk := f.read(8192):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, algorithm).hexdigest()
 
 
 def hash_dir(directory: Path, algorithm: str = "sha256") -> str:
@@ -70,7 +70,8 @@ def hash_dir(directory: Path, algorithm: str = "sha256") -> str:
 
 def hmac_sign(data: bytes, secret: bytes) -> str:
     """HMAC-SHA256 sur des données brutes."""
-    return hmac.new(secret, data, hashlib.sha256).hexdigest()
+    # hmac.digest() one-shot : calcul entièrement dans OpenSSL, sans objet HMAC
+    return hmac.digest(secret, data, "sha256").hex()
 
 
 def hmac_verify(data: bytes, secret: bytes, digest: str) -> bool:
@@ -74,8 +74,9 @@ def _compute_hmac(manifest, secret_key: bytes) -> str:
     if not src_dir.is_relative_to(root):
         raise SignatureError(f"Répertoire source {src_dir} hors du dossier plugin.")
 
+    # Filtre par nom d'abord : évite un stat() par fichier des dossiers ignorés
     files = sorted(
-        p for p in src_dir.rglob("*") if p.is_file() and not _should_ignore(p, root)
+        p for p in src_dir.rglob("*") if not _should_ignore(p, root) and p.is_file()
     )
 
     for path in files:
@@ -19,7 +19,12 @@ Contrat API attendu (REST JSON) :
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
+import os
+import tempfile
 import time
 from pathlib import Path
 from typing import Any
@@ -36,6 +41,22 @@ DEFAULT_TIMEOUT = 10
 CACHE_DIR = Path.home() / ".xcore" / "marketplace_cache"
 
 
+@functools.lru_cache(maxsize=256)
+def _safe_cache_key(key: str) -> str:
+    """
+    Nom de fichier sûr pour une clé de cache.
+
+    Les clés déjà sûres sont gardées telles quelles ; sinon les caractères
+    interdits sont remplacés et un suffixe BLAKE2s court évite que deux clés
+    distinctes (« search/a b » et « search_a_b ») partagent le même fichier.
+    """
+    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
+    if safe == key:
+        return key
+    digest = hashlib.blake2s(key.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{safe}-{digest}"
+
+
 class MarketplaceError(Exception):
     pass
 
@@ -63,6 +84,7 @@ class MarketplaceClient:
         self._api_key = raw_mkt.get("api_key", "")
         self._timeout = raw_mkt.get("timeout", DEFAULT_TIMEOUT)
         self._cache_ttl = raw_mkt.get("cache_ttl", 300)
+        self._last_sweep = 0.0
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         CACHE_DIR.chmod(0o700)
 
@@ -105,8 +127,6 @@ class MarketplaceClient:
     # ── HTTP ──────────────────────────────────────────────────
 
     async def _get(self, path: str, cache_key: str | None = None) -> Any:
-        import asyncio
-
         # Cache local
         if cache_key:
             cached = self._read_cache(cache_key)
@@ -123,8 +143,6 @@ class MarketplaceClient:
         return data
 
     async def _post(self, path: str, body: dict) -> Any:
-        import asyncio
-
         url = self._base_url + path
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: self._http_post(url, body))
@@ -178,8 +196,7 @@ class MarketplaceClient:
     # ── Cache local ───────────────────────────────────────────
 
     def _cache_path(self, key: str) -> Path:
-        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
-        return CACHE_DIR / f"{safe_key}.json"
+        return CACHE_DIR / f"{_safe_cache_key(key)}.json"
 
     def _read_cache(self, key: str) -> Any | None:
         path = self._cache_path(key)
@@ -187,7 +204,9 @@ class MarketplaceClient:
             return None
         try:
             raw = json.loads(path.read_text())
-            if time.time() - raw.get("_ts", 0) > self._cache_ttl:
+            now = time.time()
+            if now - raw.get("_ts", 0) > self._cache_ttl:
+                self._sweep_expired(path.parent, now)
                 return None
             return raw.get("data")
         except Exception:
@@ -195,10 +214,48 @@ class MarketplaceClient:
 
     def _write_cache(self, key: str, data: Any) -> None:
         path = self._cache_path(key)
+        payload = json.dumps(
+            {"_ts": time.time(), "data": data}, separators=(",", ":")
+        ).encode("utf-8")
+        tmp = None
         try:
-            path.write_text(json.dumps({"_ts": time.time(), "data": data}))
-            path.chmod(0o600)
+            # Écriture atomique : fichier temporaire (0o600 dès sa création)
+            # dans le même répertoire, puis os.replace — un lecteur concurrent
+            # ne voit jamais de JSON tronqué.
+            fd, tmp = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
         except Exception:
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+
+    def _sweep_expired(self, cache_dir: Path, now: float) -> None:
+        """
+        Supprime en une passe toutes les entrées expirées du cache.
+
+        Déclenché paresseusement par une lecture expirée, au plus une fois
+        par dixième de TTL : l'âge est lu sur le mtime (os.replace le met à
+        jour à chaque écriture), sans reparser chaque fichier JSON.
+        Les ``.tmp`` orphelins d'une écriture interrompue (crash entre mkstemp
+        et os.replace) sont purgés avec le même seuil : une écriture en cours
+        n'a jamais un TTL d'ancienneté.
+        """
+        if now - self._last_sweep < self._cache_ttl / 10:
+            return
+        self._last_sweep = now
+        try:
+            for entry in os.scandir(cache_dir):
+                if not entry.name.endswith((".json", ".tmp")):
+                    continue
+                try:
+                    if now - entry.stat().st_mtime > self._cache_ttl:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+        except OSError:
             pass
 
     def invalidate_cache(self, key: str | None = None) -> None:
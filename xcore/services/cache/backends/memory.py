@@ -5,6 +5,7 @@ Zéro dépendance externe.
 
 from __future__ import annotations
 
+import fnmatch
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
@@ -94,11 +95,10 @@ class MemoryBackend:
     async def mset(self, mapping: dict[str, Any], ttl: int | None = None) -> None:
         """Définit plusieurs clés d'un coup."""
         effective_ttl = ttl if ttl is not None else self._ttl
+        # Une seule lecture d'horloge : toutes les clés du lot expirent ensemble
+        expires_at = (time.monotonic() + effective_ttl) if effective_ttl > 0 else None
 
         for k, v in mapping.items():
-            expires_at = (
-                (time.monotonic() + effective_ttl) if effective_ttl > 0 else None
-            )
             if k in self._store:
                 self._store.move_to_end(k)
             self._store[k] = _Entry(value=v, expires_at=expires_at)
@@ -108,12 +108,10 @@ class MemoryBackend:
             self._store.popitem(last=False)
 
     async def keys(self, pattern: str | None = None) -> list[str]:
-        import fnmatch
-
-        all_keys = list(self._store.keys())
         if pattern:
-            return [k for k in all_keys if fnmatch.fnmatch(k, pattern)]
-        return all_keys
+            # filter() compile le motif une fois au lieu d'un fnmatch() par clé
+            return fnmatch.filter(self._store, pattern)
+        return list(self._store)
 
     async def ttl(self, key: str) -> float | None:
         entry = self._store.get(key)
@@ -281,9 +281,8 @@ class ServiceContainer:
 
     async def shutdown(self) -> None:
         """Arrête les services en ordre inverse."""
-        names = list(self._services.keys())
-        for name in reversed(names):
-            svc = self._services[name]
+        # Instantané unique (nom, service) : les await ci-dessous peuvent muter le dict
+        for name, svc in reversed(tuple(self._services.items())):
             try:
                 await asyncio.wait_for(svc.shutdown(), timeout=10.0)
                 logger.info("service stopped", service=name)
@@ -298,7 +297,7 @@ class ServiceContainer:
 
     async def health(self) -> dict[str, Any]:
         results = {}
-        for name, svc in self._services.items():
+        for name, svc in tuple(self._services.items()):
             try:
                 ok, msg = await asyncio.wait_for(svc.health_check(), timeout=3.0)
                 results[name] = {"ok": ok, "msg": msg}
@@ -48,6 +48,10 @@ _VALID_CONNECT_ARGS: dict[str, set[str]] = {
         "timeout",
         "command_timeout",
         "statement_cache_size",
+        # PgBouncer en mode transaction : statement_cache_size=0 +
+        # prepared_statement_cache_size=0 (cache du dialecte SQLAlchemy)
+        "prepared_statement_cache_size",
+        "server_settings",
         "ssl",
     },
     "psycopg2": {
@@ -64,6 +68,8 @@ _VALID_CONNECT_ARGS: dict[str, set[str]] = {
         "options",
         "sslmode",
         "application_name",
+        # prepare_threshold=None → pas de prepared statements (PgBouncer)
+        "prepare_threshold",
     },
     "aiosqlite": {"timeout", "check_same_thread", "uri"},
     "pysqlite": {"timeout", "check_same_thread", "uri"},
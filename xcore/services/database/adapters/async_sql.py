@@ -25,19 +25,25 @@ class AsyncSQLAdapter:
     def __init__(self, name: str, cfg: "DatabaseConfig") -> None:
         self.name = name
         self.url = cfg.url
+        self._pool_size = cfg.pool_size
+        self._max_overflow = cfg.max_overflow
         self._echo = cfg.echo
         self._pool_pre_ping = getattr(cfg, "pool_pre_ping", True)
         self._pool_recycle = getattr(cfg, "pool_recycle", 1800)
         self._pool_timeout = getattr(cfg, "pool_timeout", 30)
         self._pool_reset_on_return = getattr(cfg, "pool_reset_on_return", "rollback")
+        self._pool_use_lifo = getattr(cfg, "pool_use_lifo", False)
         self._connect_args = getattr(cfg, "connect_args", {})
         self._isolation_level = getattr(cfg, "isolation_level", None)
         self._execution_options = getattr(cfg, "execution_options", {})
         self._engine = None
+        # sqlalchemy.text résolu une fois au connect(), pas à chaque execute()
+        self._text: Any = None
         self._AsyncSession = None
 
     async def connect(self) -> None:
         try:
+            from sqlalchemy import text
             from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
             from sqlalchemy.orm import sessionmaker
         except ImportError as e:
@@ -45,6 +51,8 @@ class AsyncSQLAdapter:
                 "sqlalchemy[asyncio] non installé — pip install sqlalchemy[asyncio]"
             ) from e
 
+        self._text = text
+
         # pool_pre_ping désactivé pour aiomysql (ping() incompatible)
         # compensation : pool_recycle + invalidation sur OperationalError
         safe_pre_ping = self._pool_pre_ping and is_pre_ping_safe(self.url)
@@ -54,6 +62,11 @@ class AsyncSQLAdapter:
             "pool_pre_ping": safe_pre_ping,
             "pool_recycle": self._pool_recycle,
             "pool_timeout": self._pool_timeout,
+            # Sans ces deux clés, l'engine garde les défauts SQLAlchemy (5 + 10)
+            # quel que soit le dimensionnement déclaré dans xcore.yaml
+            "pool_size": self._pool_size,
+            "max_overflow": self._max_overflow,
+            "pool_use_lifo": self._pool_use_lifo,
         }
 
         if not safe_pre_ping and self._pool_pre_ping:
@@ -76,6 +89,9 @@ class AsyncSQLAdapter:
             engine_kwargs.pop("pool_timeout", None)
             engine_kwargs.pop("pool_recycle", None)
             engine_kwargs.pop("pool_pre_ping", None)
+            engine_kwargs.pop("pool_size", None)
+            engine_kwargs.pop("max_overflow", None)
+            engine_kwargs.pop("pool_use_lifo", None)
 
         self._engine = create_async_engine(self.url, **engine_kwargs)
 
@@ -94,7 +110,7 @@ class AsyncSQLAdapter:
         )
 
         async with self._engine.connect() as conn:
-            await conn.execute(__import__("sqlalchemy").text("SELECT 1"))
+            await conn.execute(self._text("SELECT 1"))
 
         driver = detect_driver(self.url)
         logger.info(
@@ -156,10 +172,8 @@ class AsyncSQLAdapter:
     async def execute(self, sql: str, params: dict | None = None) -> Any:
         if self._engine is None:
             raise RuntimeError(f"[{self.name}] Base non initialisée")
-        from sqlalchemy import text
-
         async with self._engine.connect() as conn:
-            return await conn.execute(text(sql), params or {})
+            return await conn.execute(self._text(sql), params or {})
 
     async def ping(self) -> tuple[bool, str]:
         try:
@@ -4,6 +4,7 @@ sql.py — Adaptateur SQLAlchemy synchrone — optimisé production.
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Generator
 
@@ -16,6 +17,14 @@ if TYPE_CHECKING:
 logger = get_logger("xcore.services.database.sql")
 
 
+def _is_memory_sqlite(url: str) -> bool:
+    """True pour une base SQLite en mémoire (sqlite://, :memory:, mode=memory)."""
+    if not url.startswith("sqlite"):
+        return False
+    path = url.split("://", 1)[-1]
+    return path in ("", "/") or ":memory:" in path or "mode=memory" in path
+
+
 class SQLAdapter:
     """
     Adaptateur SQLAlchemy sync pour SQLite, PostgreSQL, MySQL.
@@ -25,6 +34,7 @@ class SQLAdapter:
         pool_recycle         → renouvelle avant wait_timeout serveur
         pool_timeout         → timeout d'acquisition depuis le pool
         pool_reset_on_return → comportement au retour au pool
+        pool_use_lifo        → checkout LIFO (connexion la plus récente)
         connect_args         → timeouts driver-level
         isolation_level      → niveau d'isolation transactionnel
         execution_options    → options SQLAlchemy par connexion
@@ -44,19 +54,28 @@ class SQLAdapter:
         self._pool_recycle = getattr(cfg, "pool_recycle", 1800)
         self._pool_timeout = getattr(cfg, "pool_timeout", 30)
         self._pool_reset_on_return = getattr(cfg, "pool_reset_on_return", "rollback")
+        self._pool_use_lifo = getattr(cfg, "pool_use_lifo", False)
         self._connect_args = getattr(cfg, "connect_args", {})
         self._isolation_level = getattr(cfg, "isolation_level", None)
         self._execution_options = getattr(cfg, "execution_options", {})
         self._engine = None
+        # sqlalchemy.text résolu une fois au connect(), pas à chaque execute()
+        self._text: Any = None
         self._Session = None
+        # Base SQLite en mémoire : une connexion par thread (SingletonThreadPool),
+        # les appels bloquants doivent rester sur le thread de la boucle
+        self._thread_bound = _is_memory_sqlite(self.url)
 
     async def connect(self) -> None:
         try:
-            from sqlalchemy import create_engine
+            from sqlalchemy import create_engine, text
             from sqlalchemy.orm import sessionmaker
+            from sqlalchemy.pool import SingletonThreadPool
         except ImportError as e:
             raise ImportError("sqlalchemy non installé — pip install sqlalchemy") from e
 
+        self._text = text
+
         engine_kwargs: dict[str, Any] = {
             "echo": self._echo,
             "pool_pre_ping": self._pool_pre_ping,
@@ -69,6 +88,7 @@ class SQLAdapter:
             engine_kwargs["pool_size"] = self._pool_size
             engine_kwargs["max_overflow"] = self._max_overflow
             engine_kwargs["pool_timeout"] = self._pool_timeout
+            engine_kwargs["pool_use_lifo"] = self._pool_use_lifo
 
         if self._connect_args:
             sanitized = sanitize_connect_args(self.url, self._connect_args)
@@ -85,9 +105,12 @@ class SQLAdapter:
             self._engine = self._engine.execution_options(**self._execution_options)
 
         self._Session = sessionmaker(bind=self._engine)
+        self._thread_bound = self._thread_bound or isinstance(
+            self._engine.pool, SingletonThreadPool
+        )
 
-        with self._engine.connect() as conn:
-            conn.execute(__import__("sqlalchemy").text("SELECT 1"))
+        # Driver bloquant : la sonde part dans un thread pour ne pas geler la boucle
+        await self._run_blocking(self._probe)
 
         logger.info(
             "sql connected",
@@ -96,10 +119,21 @@ class SQLAdapter:
             recycle_s=self._pool_recycle,
         )
 
+    async def _run_blocking(self, fn: Any, *args: Any) -> Any:
+        # Un thread du pool ouvrirait sa propre connexion SingletonThreadPool :
+        # base :memory: vide côté sonde et connexion jamais fermée par dispose()
+        if self._thread_bound:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def _probe(self) -> None:
+        with self._engine.connect() as conn:
+            conn.execute(self._text("SELECT 1"))
+
     async def disconnect(self) -> None:
         if self._engine:
-            self._engine.dispose()
-            self._engine = None
+            engine, self._engine = self._engine, None
+            await self._run_blocking(engine.dispose)
 
     @contextmanager
     def session(self) -> Generator:
@@ -123,14 +157,12 @@ class SQLAdapter:
     def execute(self, sql: str, params: dict | None = None) -> Any:
         if self._engine is None:
             raise RuntimeError(f"[{self.name}] Base non initialisée")
-        from sqlalchemy import text
-
         with self._engine.connect() as conn:
-            return conn.execute(text(sql), params or {})
+            return conn.execute(self._text(sql), params or {})
 
     async def ping(self) -> tuple[bool, str]:
         try:
-            self.execute("SELECT 1")
+            await self._run_blocking(self.execute, "SELECT 1")
             return True, "ok"
         except Exception as e:
             return False, str(e)
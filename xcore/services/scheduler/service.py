@@ -46,7 +46,9 @@ Les autres workers voient le lock occupé et skippent silencieusement.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
+import os
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
@@ -66,10 +68,21 @@ _JOB_REGISTRY: dict[str, Callable] = {}
 # Initialisé uniquement quand backend=redis.
 _REDIS_LOCK_CLIENT: Any = None
 
+# Boucle asyncio propriétaire de _REDIS_LOCK_CLIENT : les jobs exécutés dans
+# l'executor "threadpool" y soumettent leurs opérations de lock.
+_REDIS_LOCK_LOOP: asyncio.AbstractEventLoop | None = None
+
+# Executors à base de threads : APScheduler y appelle la fonction sans l'attendre,
+# les jobs qui les ciblent passent donc par _dispatch_job_sync.
+_THREAD_EXECUTORS = frozenset({"threadpool"})
+
 # TTL du lock en secondes — suffisant pour les jobs les plus longs.
 # Si un job dépasse cette durée, le lock expire et un autre worker peut prendre la main.
 _LOCK_TTL = 300
 
+# Délai max (s) d'une opération de lock soumise depuis un thread du pool.
+_LOCK_OP_TIMEOUT = 5.0
+
 
 async def _dispatch_job(job_id: str) -> None:
     fn = _JOB_REGISTRY.get(job_id)
@@ -101,6 +114,64 @@ async def _dispatch_job(job_id: str) -> None:
             await result
 
 
+def _on_lock_loop(loop: asyncio.AbstractEventLoop, make_coro: Callable) -> Any:
+    """
+    Exécute une opération de lock sur la boucle du scheduler depuis un thread
+    du pool. Borné par _LOCK_OP_TIMEOUT : une boucle arrêtée ou fermée (arrêt
+    du process) ne bloque pas le thread indéfiniment.
+    """
+    if loop.is_closed() or not loop.is_running():
+        raise RuntimeError("scheduler event loop is not running")
+    future = asyncio.run_coroutine_threadsafe(make_coro(), loop)
+    try:
+        return future.result(timeout=_LOCK_OP_TIMEOUT)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _dispatch_job_sync(job_id: str) -> None:
+    """
+    Variante synchrone de _dispatch_job pour l'executor "threadpool".
+
+    Le job tourne dans le thread du pool ; le lock Redis (client asyncio lié à
+    la boucle du scheduler) est pris/relâché sur cette boucle.
+    """
+    fn = _JOB_REGISTRY.get(job_id)
+    if fn is None:
+        logger.warning(
+            "job not found in registry",
+            job_id=job_id,
+            reason="plugin may have been unloaded",
+        )
+        return
+
+    client, loop = _REDIS_LOCK_CLIENT, _REDIS_LOCK_LOOP
+    if client is None or loop is None:
+        fn()
+        return
+
+    lock_key = f"xcore:sched:lock:{job_id}"
+    try:
+        acquired = _on_lock_loop(
+            loop, lambda: client.set(lock_key, "1", nx=True, ex=_LOCK_TTL)
+        )
+    except Exception as e:
+        logger.warning("job skipped, lock unavailable", job_id=job_id, error=str(e))
+        return
+    if not acquired:
+        logger.debug("job skipped, already running on another worker", job_id=job_id)
+        return
+    try:
+        fn()
+    finally:
+        try:
+            _on_lock_loop(loop, lambda: client.delete(lock_key))
+        except Exception as e:
+            # Le lock expirera après _LOCK_TTL ; l'erreur du job reste visible
+            logger.warning("failed to release job lock", job_id=job_id, error=str(e))
+
+
 class SchedulerService(BaseService):
     name = "scheduler"
 
@@ -110,7 +181,7 @@ class SchedulerService(BaseService):
         self._scheduler = None
 
     async def init(self) -> None:
-        global _REDIS_LOCK_CLIENT
+        global _REDIS_LOCK_CLIENT, _REDIS_LOCK_LOOP
         self._status = ServiceStatus.INITIALIZING
         try:
             from apscheduler.jobstores.memory import MemoryJobStore
@@ -142,6 +213,7 @@ class SchedulerService(BaseService):
                     encoding="utf-8",
                     decode_responses=True,
                 )
+                _REDIS_LOCK_LOOP = asyncio.get_running_loop()
                 logger.debug("distributed lock enabled", backend="redis")
             except ImportError:
                 logger.warning(
@@ -150,6 +222,7 @@ class SchedulerService(BaseService):
 
         self._scheduler = AsyncIOScheduler(
             jobstores=jobstores,
+            executors=self._build_executors(),
             job_defaults={
                 "coalesce": True,  # fusionne les déclenchements manqués en un seul
                 "max_instances": 1,  # pas d'exécutions parallèles du même job
@@ -169,6 +242,21 @@ class SchedulerService(BaseService):
             backend=self._config.backend,
         )
 
+    def _build_executors(self) -> dict:
+        """
+        "default" reste l'AsyncIOExecutor (coroutines sur la boucle) ; les jobs
+        sync bloquants choisissent `executor="threadpool"`, un pool dimensionné
+        explicitement plutôt que l'executor par défaut de la boucle.
+        """
+        from apscheduler.executors.asyncio import AsyncIOExecutor
+        from apscheduler.executors.pool import ThreadPoolExecutor
+
+        threads = self._config.thread_pool_workers or min(32, (os.cpu_count() or 1) * 2)
+        return {
+            "default": AsyncIOExecutor(),
+            "threadpool": ThreadPoolExecutor(max_workers=threads),
+        }
+
     def _add_job_from_config(self, job_cfg: dict) -> None:
         try:
             import importlib
@@ -207,6 +295,14 @@ class SchedulerService(BaseService):
         if self._scheduler is None:
             raise RuntimeError("Scheduler non initialisé")
 
+        thread_executor = trigger_args.get("executor") in _THREAD_EXECUTORS
+        if thread_executor and inspect.iscoroutinefunction(func):
+            # Hors de la boucle de l'app, les clients async (DB, Redis…) casseraient
+            raise ValueError(
+                f"Job coroutine {func!r} incompatible avec l'executor "
+                f"{trigger_args['executor']!r} : utiliser l'executor par défaut"
+            )
+
         effective_id = job_id or getattr(func, "__name__", repr(func))
 
         # Enregistrer le callable réel localement.
@@ -214,8 +310,9 @@ class SchedulerService(BaseService):
         # + le job_id en args — 100 % sérialisable par Redis, sans aucun bound method.
         _JOB_REGISTRY[effective_id] = func
 
+        dispatcher = "_dispatch_job_sync" if thread_executor else "_dispatch_job"
         return self._scheduler.add_job(
-            "xcore.services.scheduler.service:_dispatch_job",
+            f"xcore.services.scheduler.service:{dispatcher}",
             trigger=trigger,
             id=effective_id,
             replace_existing=replace_existing,
@@ -279,12 +376,13 @@ class SchedulerService(BaseService):
     # ── Cycle de vie ──────────────────────────────────────────
 
     async def shutdown(self) -> None:
-        global _REDIS_LOCK_CLIENT
+        global _REDIS_LOCK_CLIENT, _REDIS_LOCK_LOOP
         if self._scheduler and self._scheduler.running:
             self._scheduler.shutdown(wait=False)
         if _REDIS_LOCK_CLIENT is not None:
             await _REDIS_LOCK_CLIENT.aclose()
             _REDIS_LOCK_CLIENT = None
+        _REDIS_LOCK_LOOP = None
         self._status = ServiceStatus.STOPPED
 
     async def health_check(self) -> tuple[bool, str]: